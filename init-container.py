@@ -7,45 +7,56 @@
 # Import from standard library. https://docs.python.org/3/library/
 
 import argparse
-import base64
-import configparser
-import filecmp
+import functools
 import json
-import linecache
 import logging
 import os
-import shutil
+import re
 import signal
 import string
 import sys
 import time
-import urllib
-import urllib.request
-from shutil import which
 from pathlib import Path
-from urllib.parse import urlparse, urlunparse
 
-# Determine "Major" version of Senzing SDK.
+# Heavier standard library modules (base64, concurrent.futures, configparser,
+# hashlib, io, shutil, subprocess, traceback, urllib.parse, urllib.request)
+# are imported lazily by the functions that need them; subcommands such as
+# "sleep" and "version" never pay their import cost.
 
-senzing_sdk_version_major = None
+# Determine "Major" version of Senzing SDK.  find_spec only probes for the
+# modules; the SDK itself (which loads native libraries) is imported lazily
+# by import_senzing_sdk() when a G2 resource is first built, so subcommands
+# that never touch G2 skip the load entirely.
 
-# Import from Senzing.
+try:
+    from importlib.util import find_spec
+    if find_spec("senzing") is not None:
+        senzing_sdk_version_major = 3
+    elif find_spec("G2Config") is not None:
+        senzing_sdk_version_major = 2
+    else:
+        senzing_sdk_version_major = None
+except Exception:
+    senzing_sdk_version_major = None
+
+G2Config = None
+G2ConfigMgr = None
+G2ModuleException = None
+
+# Use orjson for the entry/exit configuration dumps when it is available.
+# Fall back to the standard library.  Keys keep dict insertion order; the
+# configuration is built in a stable order already, so sorting is redundant.
 
 try:
-    from senzing import G2Config, G2ConfigMgr, G2ModuleException
-    senzing_sdk_version_major = 3
+    import orjson
 
-except Exception:
+    def json_dumps(an_object):
+        return orjson.dumps(an_object, default=str).decode()  # pylint: disable=no-member
 
-    # Fall back to pre-Senzing-Python-SDK style of imports.
+except ImportError:
 
-    try:
-        from G2Config import G2Config
-        from G2ConfigMgr import G2ConfigMgr
-        from G2Exception import G2ModuleException
-        senzing_sdk_version_major = 2
-    except Exception:
-        senzing_sdk_version_major = None
+    def json_dumps(an_object):
+        return json.dumps(an_object)
 
 # Metadata
 
@@ -57,17 +68,36 @@ __updated__ = '2023-06-15'
 SENZING_PRODUCT_ID = "5007"  # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-product-ids.md
 log_format = '%(asctime)s %(message)s'
 
+# Map SENZING_LOG_LEVEL values to logging levels.
+# See https://docs.python.org/3/library/logging.html#levels
+
+log_level_map = {
+    "notset": logging.NOTSET,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "fatal": logging.FATAL,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL
+}
+
 # Working with bytes.
 
 KILOBYTES = 1024
 MEGABYTES = 1024 * KILOBYTES
 GIGABYTES = 1024 * MEGABYTES
 
-# Lists from https://www.ietf.org/rfc/rfc1738.txt
+# Character classes from https://www.ietf.org/rfc/rfc1738.txt, kept as
+# single strings: iteration order matters (the translation tables pair
+# characters positionally) and one string is cheaper than a list of
+# one-character objects.
+
+safe_character_string = '$-_.+!*(),"' + string.ascii_letters
+unsafe_character_string = '"<>#%{}|\\^~[]`'
+reserved_character_string = ';,/?:@=&'
 
-safe_character_list = ['$', '-', '_', '.', '+', '!', '*', '(', ')', ',', '"'] + list(string.ascii_letters)
-unsafe_character_list = ['"', '<', '>', '#', '%', '{', '}', '|', '\\', '^', '~', '[', ']', '`']
-reserved_character_list = [';', ',', '/', '?', ':', '@', '=', '&']
+unsafe_character_set = frozenset(unsafe_character_string)
+safe_character_set = frozenset(safe_character_string)
 
 # The "configuration_locator" describes where configuration variables are in:
 # 1) Command line options, 2) Environment variables, 3) Configuration files, 4) Default values
@@ -90,11 +120,13 @@ configuration_locator = {
     },
     "debug": {
         "default": False,
+        "type": bool,
         "env": "SENZING_DEBUG",
         "cli": "debug"
     },
     "delay_in_seconds": {
         "default": 0,
+        "type": int,
         "env": "SENZING_DELAY_IN_SECONDS",
         "cli": "delay-in-seconds"
     },
@@ -105,21 +137,25 @@ configuration_locator = {
     },
     "enable_db2": {
         "default": False,
+        "type": bool,
         "env": "SENZING_ENABLE_DB2",
         "cli": "enable-db2"
     },
     "enable_mssql": {
         "default": False,
+        "type": bool,
         "env": "SENZING_ENABLE_MSSQL",
         "cli": "enable-mssql"
     },
     "enable_mysql": {
         "default": False,
+        "type": bool,
         "env": "SENZING_ENABLE_MYSQL",
         "cli": "enable-mysql"
     },
     "enable_postgresql": {
         "default": False,
+        "type": bool,
         "env": "SENZING_ENABLE_POSTGRESQL",
         "cli": "enable-postgresql"
     },
@@ -150,6 +186,7 @@ configuration_locator = {
     },
     "generate_ssl_keystore": {
         "default": False,
+        "type": bool,
         "env": "SENZING_GENERATE_SSL_KEYSTORE",
         "cli": "generate-ssl-keystore"
     },
@@ -165,6 +202,7 @@ configuration_locator = {
     },
     "sleep_time_in_seconds": {
         "default": 0,
+        "type": int,
         "env": "SENZING_SLEEP_TIME_IN_SECONDS",
         "cli": "sleep-time-in-seconds"
     },
@@ -193,6 +231,7 @@ configuration_locator = {
     },
     "update_ini_files": {
         "default": False,
+        "type": bool,
         "env": "SENZING_UPDATE_INI_FILES",
         "cli": "update-ini-files"
     },
@@ -203,187 +242,254 @@ configuration_locator = {
     },
 }
 
+# Flatten 'configuration_locator' into tuples resolved once at import time,
+# so get_configuration() scans pre-resolved pairs instead of probing each
+# per-key dictionary on every call.
+
+configuration_locator_defaults = tuple(
+    (key, value.get('default')) for key, value in configuration_locator.items()
+)
+configuration_locator_env_vars = tuple(
+    (key, value['env']) for key, value in configuration_locator.items() if 'env' in value
+)
+configuration_locator_types = tuple(
+    (key, value['type']) for key, value in configuration_locator.items() if 'type' in value
+)
+
+# String values accepted as "true" for boolean configuration values.
+
+true_string_values = frozenset(['true', '1', 't', 'y', 'yes'])
+
 # Enumerate keys in 'configuration_locator' that should not be printed to the log.
 
 keys_to_redact = [
+    "_cached_configuration_json",
+    "_cached_engine_configuration",
     "engine_configuration_json",
     "g2_database_url",
     "g2_database_url_raw",
 ]
 
+keys_to_redact_set = frozenset(keys_to_redact)
+
+# File permission specifications applied by change_file_permissions.
+# "{etc}" and "{var}" are replaced with the configured directories.
+
+file_permission_specifications = (
+    ("{etc}/G2Module.ini", 0o750),
+    ("{etc}/G2Project.ini", 0o750),
+    ("{var}/sqlite", 0o750),
+    ("{var}/sqlite/G2C.db", 0o750),
+    ("{var}/sqlite/G2C_LIBFEAT.db", 0o750),
+    ("{var}/sqlite/G2C_RES.db", 0o750),
+    ("{var}/sqlite/G2C.db.template", 0o440),
+    ("/opt/microsoft/msodbcsql17/etc/odbc.ini", 0o750),
+    ("/opt/IBM/db2/clidriver/cfg/db2dsdriver.cfg", 0o755),
+)
+
+# Database-specific URL templates, keyed by scheme.
+
+# Precompiled placeholder pattern for rendering "{key}" templates line by
+# line without re-walking the format-string grammar on every call.
+
+template_placeholder_pattern = re.compile(r'\{(\w+)\}')
+
+database_url_format_map = {
+    'mysql': "{scheme}://{username}:{password}@{hostname}:{port}/?schema={schema}",
+    'postgresql': "{scheme}://{username}:{password}@{hostname}:{port}:{schema}/",
+    'db2': "{scheme}://{username}:{password}@{schema}",
+    'sqlite3': "{scheme}://{netloc}{path}",
+    'mssql': "{scheme}://{username}:{password}@{schema}",
+}
+
 # Global cached objects
 
 g2_configuration_manager_singleton = None
 g2_config_singleton = None
 
+# Assembled configurations, keyed by (args, environment).
+
+configuration_cache = {}
+
 # -----------------------------------------------------------------------------
 # Define argument parser
 # -----------------------------------------------------------------------------
 
 
-def get_parser():
-    ''' Parse commandline arguments. '''
+# The "subcommands" and "argument_aspects" tables are static; they are built
+# once at import time rather than on every get_parser() call.
 
-    subcommands = {
-        'debug-database-url': {
-            "help": 'Show parsed database URL.  Does not modify system.',
-            "argument_aspects": ["common"],
-        },
-        'initialize': {
-            "help": 'Initialize a newly installed Senzing',
-            "argument_aspects": ["common", "senzing-volumes", "enable", "keystore", "uidgid"],
+subcommands = {
+    'debug-database-url': {
+        "help": 'Show parsed database URL.  Does not modify system.',
+        "argument_aspects": ["common"],
+    },
+    'initialize': {
+        "help": 'Initialize a newly installed Senzing',
+        "argument_aspects": ["common", "senzing-volumes", "enable", "keystore", "uidgid"],
+    },
+    'initialize-database': {
+        "help": 'Initialize only the database. This is a subset of the full initialize sub-commmand',
+        "argument_aspects": ["common", "senzing-volumes"],
+        "arguments": {
+            "--update-ini-files": {
+                "dest": "update_ini_files",
+                "action": "store_true",
+                "help": "Update INI files: G2Module.ini, (SENZING_UPDATE_INI_FILES) Default: False"
+            },
         },
-        'initialize-database': {
-            "help": 'Initialize only the database. This is a subset of the full initialize sub-commmand',
-            "argument_aspects": ["common", "senzing-volumes"],
-            "arguments": {
-                "--update-ini-files": {
-                    "dest": "update_ini_files",
-                    "action": "store_true",
-                    "help": "Update INI files: G2Module.ini, (SENZING_UPDATE_INI_FILES) Default: False"
-                },
+    },
+    'initialize-files': {
+        "help": 'Initialize only the files. This is a subset of the full initialize sub-commmand',
+        "argument_aspects": ["common", "senzing-volumes", "enable", "keystore", "uidgid"],
+    },
+    'sleep': {
+        "help": 'Do nothing but sleep. For Docker testing.',
+        "arguments": {
+            "--sleep-time-in-seconds": {
+                "dest": "sleep_time_in_seconds",
+                "metavar": "SENZING_SLEEP_TIME_IN_SECONDS",
+                "help": "Sleep time in seconds. DEFAULT: 0 (infinite)"
             },
         },
-        'initialize-files': {
-            "help": 'Initialize only the files. This is a subset of the full initialize sub-commmand',
-            "argument_aspects": ["common", "senzing-volumes", "enable", "keystore", "uidgid"],
+    },
+    'version': {
+        "help": 'Print version of program.',
+    },
+    'docker-acceptance-test': {
+        "help": 'For Docker acceptance testing.',
+    },
+}
+
+# Define argument_aspects.
+
+argument_aspects = {
+    "common": {
+        "--cloud": {
+            "dest": "cloud",
+            "metavar": "SENZING_CLOUD",
+            "help": "Cloud provider in use. Default: none"
         },
-        'sleep': {
-            "help": 'Do nothing but sleep. For Docker testing.',
-            "arguments": {
-                "--sleep-time-in-seconds": {
-                    "dest": "sleep_time_in_seconds",
-                    "metavar": "SENZING_SLEEP_TIME_IN_SECONDS",
-                    "help": "Sleep time in seconds. DEFAULT: 0 (infinite)"
-                },
-            },
+        "--db2dsdriver-cfg-contents": {
+            "dest": "db2dsdriver_cfg_contents",
+            "metavar": "SENZING_OPT_IBM_DB2_CLIDRIVER_CFG_DB2DSDRIVER_CFG_CONTENTS",
+            "help": "Contents of the Db2 db2dsdriver.cfg file for advanced Db2 configurations or Senzing Clustering. Default: none"
         },
-        'version': {
-            "help": 'Print version of program.',
+        "--database-url": {
+            "dest": "g2_database_url",
+            "metavar": "SENZING_DATABASE_URL",
+            "help": "Information for connecting to database."
         },
-        'docker-acceptance-test': {
-            "help": 'For Docker acceptance testing.',
+        "--debug": {
+            "dest": "debug",
+            "action": "store_true",
+            "help": "Enable debugging. (SENZING_DEBUG) Default: False"
         },
-    }
-
-    # Define argument_aspects.
-
-    argument_aspects = {
-        "common": {
-            "--cloud": {
-                "dest": "cloud",
-                "metavar": "SENZING_CLOUD",
-                "help": "Cloud provider in use. Default: none"
-            },
-            "--db2dsdriver-cfg-contents": {
-                "dest": "db2dsdriver_cfg_contents",
-                "metavar": "SENZING_OPT_IBM_DB2_CLIDRIVER_CFG_DB2DSDRIVER_CFG_CONTENTS",
-                "help": "Contents of the Db2 db2dsdriver.cfg file for advanced Db2 configurations or Senzing Clustering. Default: none"
-            },
-            "--database-url": {
-                "dest": "g2_database_url",
-                "metavar": "SENZING_DATABASE_URL",
-                "help": "Information for connecting to database."
-            },
-            "--debug": {
-                "dest": "debug",
-                "action": "store_true",
-                "help": "Enable debugging. (SENZING_DEBUG) Default: False"
-            },
-            "--delay-in-seconds": {
-                "dest": "delay_in_seconds",
-                "metavar": "SENZING_DELAY_IN_SECONDS",
-                "help": "Delay before processing in seconds. DEFAULT: 0"
-            },
-            "--engine-configuration-json": {
-                "dest": "engine_configuration_json",
-                "metavar": "SENZING_ENGINE_CONFIGURATION_JSON",
-                "help": "Advanced Senzing engine configuration. Default: none"
-            },
-            "--generate-ssl-keystore": {
-                "dest": "generate_ssl_keystore",
-                "action": "store_true",
-                "help": "Generate SSL Keystore files. (SENZING_GENERATE_SSL_KEYSTORE) Default: False"
-            },
-            "--mssql-odbc-ini-contents": {
-                "dest": "mssql_odbc_ini_contents",
-                "metavar": "SENZING_OPT_MICROSOFT_MSODBCSQL17_ETC_ODBC_INI_CONTENTS",
-                "help": "Contents of the odbc.ini file when used with mssql. Default: none"
-            },
-            "--stackname": {
-                "dest": "stackname",
-                "metavar": "SENZING_STACK_NAME",
-                "help": "AWS cloudformation stack name. Default: none"
-            }
+        "--delay-in-seconds": {
+            "dest": "delay_in_seconds",
+            "metavar": "SENZING_DELAY_IN_SECONDS",
+            "help": "Delay before processing in seconds. DEFAULT: 0"
         },
-        "enable": {
-            "--enable-db2": {
-                "dest": "enable_db2",
-                "action": "store_true",
-                "help": "Enable db2 database. (SENZING_ENABLE_DB2) Default: False"
-            },
-            "--enable-mssql": {
-                "dest": "enable_mssql",
-                "action": "store_true",
-                "help": "Enable MS SQL database. (SENZING_ENABLE_MSSQL) Default: False"
-            },
-            "--enable-mysql": {
-                "dest": "enable_mysql",
-                "action": "store_true",
-                "help": "Enable MySQL database. (SENZING_ENABLE_MYSQL) Default: False"
-            },
-            "--enable-postgresql": {
-                "dest": "enable_postgresql",
-                "action": "store_true",
-                "help": "Enable PostgreSQL database. (SENZING_ENABLE_POSTGRESQL) Default: False"
-            },
+        "--engine-configuration-json": {
+            "dest": "engine_configuration_json",
+            "metavar": "SENZING_ENGINE_CONFIGURATION_JSON",
+            "help": "Advanced Senzing engine configuration. Default: none"
         },
-        "senzing-volumes": {
-            "--etc-dir": {
-                "dest": "etc_dir",
-                "metavar": "SENZING_ETC_DIR",
-                "help": "Location of senzing etc directory. Default: /etc/opt/senzing"
-            },
-            "--g2-dir": {
-                "dest": "g2_dir",
-                "metavar": "SENZING_G2_DIR",
-                "help": "Location of senzing g2 directory. Default: /opt/senzing/g2"
-            },
-            "--data-dir": {
-                "dest": "data_dir",
-                "metavar": "SENZING_DATA_DIR",
-                "help": "Location of Senzing's support. Default: /opt/senzing/g2/data"
-            },
-            "--var-dir": {
-                "dest": "var_dir",
-                "metavar": "SENZING_VAR_DIR",
-                "help": "Location of senzing var directory. Default: /var/opt/senzing"
-            },
+        "--generate-ssl-keystore": {
+            "dest": "generate_ssl_keystore",
+            "action": "store_true",
+            "help": "Generate SSL Keystore files. (SENZING_GENERATE_SSL_KEYSTORE) Default: False"
         },
-        "uidgid": {
-            "--gid": {
-                "dest": "gid",
-                "metavar": "SENZING_GID",
-                "help": "GID for file ownership. Default: 1001"
-            },
-            "--uid": {
-                "dest": "uid",
-                "metavar": "SENZING_UID",
-                "help": "UID for file ownership. Default: 1001"
-            },
+        "--mssql-odbc-ini-contents": {
+            "dest": "mssql_odbc_ini_contents",
+            "metavar": "SENZING_OPT_MICROSOFT_MSODBCSQL17_ETC_ODBC_INI_CONTENTS",
+            "help": "Contents of the odbc.ini file when used with mssql. Default: none"
         },
-    }
-
-    # Augment "subcommands" variable with arguments specified by aspects.
+        "--stackname": {
+            "dest": "stackname",
+            "metavar": "SENZING_STACK_NAME",
+            "help": "AWS cloudformation stack name. Default: none"
+        }
+    },
+    "enable": {
+        "--enable-db2": {
+            "dest": "enable_db2",
+            "action": "store_true",
+            "help": "Enable db2 database. (SENZING_ENABLE_DB2) Default: False"
+        },
+        "--enable-mssql": {
+            "dest": "enable_mssql",
+            "action": "store_true",
+            "help": "Enable MS SQL database. (SENZING_ENABLE_MSSQL) Default: False"
+        },
+        "--enable-mysql": {
+            "dest": "enable_mysql",
+            "action": "store_true",
+            "help": "Enable MySQL database. (SENZING_ENABLE_MYSQL) Default: False"
+        },
+        "--enable-postgresql": {
+            "dest": "enable_postgresql",
+            "action": "store_true",
+            "help": "Enable PostgreSQL database. (SENZING_ENABLE_POSTGRESQL) Default: False"
+        },
+    },
+    "senzing-volumes": {
+        "--etc-dir": {
+            "dest": "etc_dir",
+            "metavar": "SENZING_ETC_DIR",
+            "help": "Location of senzing etc directory. Default: /etc/opt/senzing"
+        },
+        "--g2-dir": {
+            "dest": "g2_dir",
+            "metavar": "SENZING_G2_DIR",
+            "help": "Location of senzing g2 directory. Default: /opt/senzing/g2"
+        },
+        "--data-dir": {
+            "dest": "data_dir",
+            "metavar": "SENZING_DATA_DIR",
+            "help": "Location of Senzing's support. Default: /opt/senzing/g2/data"
+        },
+        "--var-dir": {
+            "dest": "var_dir",
+            "metavar": "SENZING_VAR_DIR",
+            "help": "Location of senzing var directory. Default: /var/opt/senzing"
+        },
+    },
+    "uidgid": {
+        "--gid": {
+            "dest": "gid",
+            "metavar": "SENZING_GID",
+            "help": "GID for file ownership. Default: 1001"
+        },
+        "--uid": {
+            "dest": "uid",
+            "metavar": "SENZING_UID",
+            "help": "UID for file ownership. Default: 1001"
+        },
+    },
+}
 
-    for subcommand, subcommand_value in subcommands.items():
-        if 'argument_aspects' in subcommand_value:
-            for aspect in subcommand_value['argument_aspects']:
-                if 'arguments' not in subcommands[subcommand]:
-                    subcommands[subcommand]['arguments'] = {}
-                arguments = argument_aspects.get(aspect, {})
-                for argument, argument_value in arguments.items():
-                    subcommands[subcommand]['arguments'][argument] = argument_value
+# Augment "subcommands" variable with arguments specified by aspects.
+# Done once at import time so get_parser() does not repeat the merge.
+
+for subcommand_key, subcommand_value in subcommands.items():
+    if 'argument_aspects' in subcommand_value:
+        for aspect in subcommand_value['argument_aspects']:
+            if 'arguments' not in subcommand_value:
+                subcommand_value['arguments'] = {}
+            arguments = argument_aspects.get(aspect, {})
+            for argument, argument_value in arguments.items():
+                subcommand_value['arguments'][argument] = argument_value
+
+
+@functools.lru_cache(maxsize=2)
+def get_parser(only_subcommand=None):
+    ''' Parse commandline arguments.
+        When only_subcommand names a known subcommand, just that subparser
+        is populated with arguments; an invocation uses exactly one, and
+        skipping the rest keeps argparse construction off the startup path.
+        Help output always builds the full tree.
+    '''
 
     parser = argparse.ArgumentParser(prog="init-container.py", description="Initialize Senzing installation. For more information, see https://github.com/senzing-garage/docker-init-container")
     subparsers = parser.add_subparsers(dest='subcommand', help='Subcommands (SENZING_SUBCOMMAND):')
@@ -392,6 +498,8 @@ def get_parser():
         subcommand_help = subcommand_values.get('help', "")
         subcommand_arguments = subcommand_values.get('arguments', {})
         subparser = subparsers.add_parser(subcommand_key, help=subcommand_help)
+        if only_subcommand is not None and subcommand_key != only_subcommand:
+            continue
         for argument_key, argument_values in subcommand_arguments.items():
             subparser.add_argument(argument_key, **argument_values)
 
@@ -414,87 +522,106 @@ MESSAGE_ERROR = 700
 MESSAGE_DEBUG = 900
 
 message_dictionary = {
-    "100": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}I",
-    "151": "{0} - Changing permissions from {1:o} to {2:o}",
-    "152": "{0} - Changing owner from {1} to {2}",
-    "153": "{0} - Changing group from {1} to {2}",
-    "154": "{0} - Creating file by copying {1}",
-    "155": "{0} - Deleting",
-    "156": "{0} - Modified. {1}",
-    "157": "{0} - Creating file",
-    "158": "{0} - Creating symlink to {1}",
-    "159": "{0} - Downloading from {1}",
-    "160": "{0} - Copying {1} and modifying",
-    "161": "{0} - Backup of current {1}",
-    "162": "{0} - Creating directory",
-    "163": "{0} - Configuring for Senzing database cluster based on SENZING_ENGINE_CONFIGURATION_JSON",
-    "170": "Created new default config in SYS_CFG having ID {0}",
-    "171": "Default config in SYS_CFG already exists having ID {0}",
-    "180": "{0} - Postgresql detected.  Installing governor from {1}",
-    "181": "{0} - Postgresql detected. Using existing governor; no change.",
-    "182": "Initializing for SQLite",
-    "183": "Initializing for Db2",
-    "184": "Initializing for MS SQL",
-    "185": "Initializing for MySQL",
-    "186": "Initializing for PostgreSQL",
-    "187": "{0} - Directory does not exist; no change.",
-    "188": "{0} - Cannot write to read-only filesystem; no change.",
-    "292": "Configuration change detected.  Old: {0} New: {1}",
-    "293": "For information on warnings and errors, see https://github.com/senzing-garage/stream-loader#errors",
-    "294": "Version: {0}  Updated: {1}",
-    "295": "Sleeping infinitely.",
-    "296": "Sleeping {0} seconds.",
-    "297": "Enter {0}",
-    "298": "Exit {0}",
-    "299": "{0}",
-    "300": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}W",
-    "301": "Could not download the senzing postgresql governor from {0}. Ignore this on air gapped systems. Exception details: {1}",
-    "499": "{0}",
-    "500": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
-    "510": "{0} - File is missing.",
-    "695": "Unknown database scheme '{0}' in database url '{1}'",
-    "696": "Bad SENZING_SUBCOMMAND: {0}.",
-    "697": "No processing done.",
-    "698": "Program terminated with error.",
-    "699": "{0}",
-    "700": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
-    "701": "Error '{0}' caused by {1} error '{2}'",
-    "702": "Could not create '{0}' directory. Error: {1}",
-    "703": "SENZING_ENGINE_CONFIGURATION_JSON specified but not SENZING_OPT_IBM_DB2_CLIDRIVER_CFG_DB2DSDRIVER_CFG_CONTENTS. If the Senzing engine config is specified, the contents of db2dsdriver.cfg must also be provided.",
-    "704": "SENZING_ENGINE_CONFIGURATION_JSON specified but not SENZING_OPT_MICROSOFT_MSODBCSQL17_ETC_ODBC_INI_CONTENTS. If the Senzing engine config is specified, the contents of odbc.ini must also be provided.",
-    "801": "SENZING_ENGINE_CONFIGURATION_JSON contains multiple database schemes: {0}",
-    "879": "Senzing SDK was not imported.",
-    "886": "G2Engine.addRecord() bad return code: {0}; JSON: {1}",
-    "888": "G2Engine.addRecord() G2ModuleNotInitialized: {0}; JSON: {1}",
-    "889": "G2Engine.addRecord() G2ModuleGenericException: {0}; JSON: {1}",
-    "890": "G2Engine.addRecord() Exception: {0}; JSON: {1}",
-    "891": "Original and new database URLs do not match. Original URL: {0}; Reconstructed URL: {1}",
-    "892": "Could not initialize G2Product with '{0}'. Error: {1}",
-    "893": "Could not initialize G2Hasher with '{0}'. Error: {1}",
-    "894": "Could not initialize G2Diagnostic with '{0}'. Error: {1}",
-    "895": "Could not initialize G2Audit with '{0}'. Error: {1}",
-    "896": "Could not initialize G2ConfigMgr with '{0}'. Error: {1}",
-    "897": "Could not initialize G2Config with '{0}'. Error: {1}",
-    "898": "Could not initialize G2Engine with '{0}'. Error: {1}",
-    "899": "{0}",
-    "900": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}D",
-    "901": "{0} will not be modified",
-    "902": "{0} - Was not created because there is no {1}",
-    "950": "Enter function: {0}",
-    "951": "Exit  function: {0}",
-    "998": "Debugging enabled.",
-    "999": "{0}",
+    100: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}I",
+    151: "{0} - Changing permissions from {1:o} to {2:o}",
+    152: "{0} - Changing owner from {1} to {2}",
+    153: "{0} - Changing group from {1} to {2}",
+    154: "{0} - Creating file by copying {1}",
+    155: "{0} - Deleting",
+    156: "{0} - Modified. {1}",
+    157: "{0} - Creating file",
+    158: "{0} - Creating symlink to {1}",
+    159: "{0} - Downloading from {1}",
+    160: "{0} - Copying {1} and modifying",
+    161: "{0} - Backup of current {1}",
+    162: "{0} - Creating directory",
+    163: "{0} - Configuring for Senzing database cluster based on SENZING_ENGINE_CONFIGURATION_JSON",
+    170: "Created new default config in SYS_CFG having ID {0}",
+    171: "Default config in SYS_CFG already exists having ID {0}",
+    180: "{0} - Postgresql detected.  Installing governor from {1}",
+    181: "{0} - Postgresql detected. Using existing governor; no change.",
+    182: "Initializing for SQLite",
+    183: "Initializing for Db2",
+    184: "Initializing for MS SQL",
+    185: "Initializing for MySQL",
+    186: "Initializing for PostgreSQL",
+    187: "{0} - Directory does not exist; no change.",
+    188: "{0} - Cannot write to read-only filesystem; no change.",
+    292: "Configuration change detected.  Old: {0} New: {1}",
+    293: "For information on warnings and errors, see https://github.com/senzing-garage/stream-loader#errors",
+    294: "Version: {0}  Updated: {1}",
+    295: "Sleeping infinitely.",
+    296: "Sleeping {0} seconds.",
+    297: "Enter {0}",
+    298: "Exit {0}",
+    299: "{0}",
+    300: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}W",
+    301: "Could not download the senzing postgresql governor from {0}. Ignore this on air gapped systems. Exception details: {1}",
+    499: "{0}",
+    500: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
+    510: "{0} - File is missing.",
+    695: "Unknown database scheme '{0}' in database url '{1}'",
+    696: "Bad SENZING_SUBCOMMAND: {0}.",
+    697: "No processing done.",
+    698: "Program terminated with error.",
+    699: "{0}",
+    700: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
+    701: "Error '{0}' caused by {1} error '{2}'",
+    702: "Could not create '{0}' directory. Error: {1}",
+    703: "SENZING_ENGINE_CONFIGURATION_JSON specified but not SENZING_OPT_IBM_DB2_CLIDRIVER_CFG_DB2DSDRIVER_CFG_CONTENTS. If the Senzing engine config is specified, the contents of db2dsdriver.cfg must also be provided.",
+    704: "SENZING_ENGINE_CONFIGURATION_JSON specified but not SENZING_OPT_MICROSOFT_MSODBCSQL17_ETC_ODBC_INI_CONTENTS. If the Senzing engine config is specified, the contents of odbc.ini must also be provided.",
+    801: "SENZING_ENGINE_CONFIGURATION_JSON contains multiple database schemes: {0}",
+    879: "Senzing SDK was not imported.",
+    886: "G2Engine.addRecord() bad return code: {0}; JSON: {1}",
+    888: "G2Engine.addRecord() G2ModuleNotInitialized: {0}; JSON: {1}",
+    889: "G2Engine.addRecord() G2ModuleGenericException: {0}; JSON: {1}",
+    890: "G2Engine.addRecord() Exception: {0}; JSON: {1}",
+    891: "Original and new database URLs do not match. Original URL: {0}; Reconstructed URL: {1}",
+    892: "Could not initialize G2Product with '{0}'. Error: {1}",
+    893: "Could not initialize G2Hasher with '{0}'. Error: {1}",
+    894: "Could not initialize G2Diagnostic with '{0}'. Error: {1}",
+    895: "Could not initialize G2Audit with '{0}'. Error: {1}",
+    896: "Could not initialize G2ConfigMgr with '{0}'. Error: {1}",
+    897: "Could not initialize G2Config with '{0}'. Error: {1}",
+    898: "Could not initialize G2Engine with '{0}'. Error: {1}",
+    899: "{0}",
+    900: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}D",
+    901: "{0} will not be modified",
+    902: "{0} - Was not created because there is no {1}",
+    950: "Enter function: {0}",
+    951: "Exit  function: {0}",
+    998: "Debugging enabled.",
+    999: "{0}",
 }
 
 
+# Bind each template's str.format method once so message() is a dict probe
+# plus a single format call, with no per-call template re-parse.
+
+message_format_map = {index: template.format for index, template in message_dictionary.items()}
+
+
 def message(index, *args):
-    index_string = str(index)
-    template = message_dictionary.get(index_string, "No message for index {0}.".format(index_string))
-    return template.format(*args)
+    template_format = message_format_map.get(index)
+    if template_format is None:
+        return "No message for index {0}.".format(index)
+    return template_format(*args)
+
+
+@functools.lru_cache(maxsize=None)
+def message_composite(generic_index, index):
+    ''' Compose the "senzing-...I" prefix with the body template once per
+        (generic_index, index) pair.  The prefix is fully formatted here;
+        the body's placeholders survive for the per-call argument format.
+    '''
+    template = message_dictionary.get(index)
+    if template is None:
+        template = "No message for index {0}.".format(index)
+    return "{0} {1}".format(message(generic_index, index), template)
 
 
 def message_generic(generic_index, index, *args):
-    return "{0} {1}".format(message(generic_index, index), message(index, *args))
+    return message_composite(generic_index, index).format(*args)
 
 
 def message_info(index, *args):
@@ -515,19 +642,16 @@ def message_debug(index, *args):
 
 def get_exception():
     ''' Get details about an exception. '''
-    exception_type, exception_object, traceback = sys.exc_info()
-    frame = traceback.tb_frame
-    line_number = traceback.tb_lineno
-    filename = frame.f_code.co_filename
-    linecache.checkcache(filename)
-    line = linecache.getline(filename, line_number, frame.f_globals)
+    import traceback as traceback_module
+    exception_type, exception_object, exception_traceback = sys.exc_info()
+    frame_summary = traceback_module.extract_tb(exception_traceback, limit=1)[0]
     return {
-        "filename": filename,
-        "line_number": line_number,
-        "line": line.strip(),
+        "filename": frame_summary.filename,
+        "line_number": frame_summary.lineno,
+        "line": (frame_summary.line or "").strip(),
         "exception": exception_object,
         "type": exception_type,
-        "traceback": traceback,
+        "traceback": exception_traceback,
     }
 
 # -----------------------------------------------------------------------------
@@ -535,31 +659,23 @@ def get_exception():
 # -----------------------------------------------------------------------------
 
 
-def translate(mapping, astring):
-    new_string = str(astring)
-    for key, value in mapping.items():
-        new_string = new_string.replace(key, value)
-    return new_string
-
-
 def get_unsafe_characters(astring):
-    result = []
-    for unsafe_character in unsafe_character_list:
-        if unsafe_character in astring:
-            result.append(unsafe_character)
-    return result
+    characters = set(astring)
+    return [unsafe_character for unsafe_character in unsafe_character_string if unsafe_character in characters]
 
 
 def get_safe_characters(astring):
-    result = []
-    for safe_character in safe_character_list:
-        if safe_character not in astring:
-            result.append(safe_character)
-    return result
+    characters = set(astring)
+    return [safe_character for safe_character in safe_character_string if safe_character not in characters]
 
 
+@functools.lru_cache(maxsize=8)
 def parse_database_url(original_senzing_database_url):
-    ''' Given a canonical database URL, decompose into URL components. '''
+    ''' Given a canonical database URL, decompose into URL components.
+        Results are memoized; the URL does not change within a run, so
+        callers share one parse.  Callers must not modify the result.
+    '''
+    from urllib.parse import urlparse, urlunparse
 
     result = {}
 
@@ -567,9 +683,27 @@ def parse_database_url(original_senzing_database_url):
 
     senzing_database_url = original_senzing_database_url
 
-    # Create lists of safe and unsafe characters.
+    # Create lists of safe and unsafe characters.  In the common case the
+    # URL contains no unsafe characters and no translation is needed, so
+    # parse it directly and skip the table building below.
 
     unsafe_characters = get_unsafe_characters(senzing_database_url)
+    if not unsafe_characters:
+        parsed = urlparse(senzing_database_url)
+        return {
+            'scheme': parsed.scheme,
+            'netloc': parsed.netloc,
+            'path': parsed.path,
+            'params': parsed.params,
+            'query': parsed.query,
+            'fragment': parsed.fragment,
+            'username': parsed.username,
+            'password': parsed.password,
+            'hostname': parsed.hostname,
+            'port': parsed.port,
+            'schema': parsed.path.strip('/'),
+        }
+
     safe_characters = get_safe_characters(senzing_database_url)
 
     # Detect an error condition where there are not enough safe characters.
@@ -578,40 +712,35 @@ def parse_database_url(original_senzing_database_url):
         logging.error(message_error(730, unsafe_characters, safe_characters))
         return result
 
-    # Perform translation.
-    # This makes a map of safe character mapping to unsafe characters.
+    # Perform translation with str.translate tables.
+    # The forward table maps unsafe characters to safe characters;
+    # the reverse table restores them after parsing.
     # "senzing_database_url" is modified to have only safe characters.
 
-    translation_map = {}
-    safe_characters_index = 0
-    for unsafe_character in unsafe_characters:
-        safe_character = safe_characters[safe_characters_index]
-        safe_characters_index += 1
-        translation_map[safe_character] = unsafe_character
-        senzing_database_url = senzing_database_url.replace(unsafe_character, safe_character)
+    forward_table = str.maketrans(dict(zip(unsafe_characters, safe_characters)))
+    reverse_table = str.maketrans(dict(zip(safe_characters, unsafe_characters)))
+    senzing_database_url = senzing_database_url.translate(forward_table)
 
     # Parse "translated" URL.
 
     parsed = urlparse(senzing_database_url)
     schema = parsed.path.strip('/')
 
-    # Construct result.
+    # Construct result.  The components are joined with a NUL separator
+    # (which never appears in a URL or the translation tables) so one
+    # translate pass restores all of them, instead of one pass per field.
 
-    result = {
-        'scheme': translate(translation_map, parsed.scheme),
-        'netloc': translate(translation_map, parsed.netloc),
-        'path': translate(translation_map, parsed.path),
-        'params': translate(translation_map, parsed.params),
-        'query': translate(translation_map, parsed.query),
-        'fragment': translate(translation_map, parsed.fragment),
-        'username': translate(translation_map, parsed.username),
-        'password': translate(translation_map, parsed.password),
-        'hostname': translate(translation_map, parsed.hostname),
-        'port': translate(translation_map, parsed.port),
-        'schema': translate(translation_map, schema),
-    }
+    field_names = ('scheme', 'netloc', 'path', 'params', 'query', 'fragment', 'username', 'password', 'hostname', 'port', 'schema')
+    joined_fields = "\x00".join(str(field) for field in (
+        parsed.scheme, parsed.netloc, parsed.path, parsed.params, parsed.query,
+        parsed.fragment, parsed.username, parsed.password, parsed.hostname,
+        parsed.port, schema,
+    ))
+    result = dict(zip(field_names, joined_fields.translate(reverse_table).split("\x00")))
 
-    # For safety, compare original URL with reconstructed URL.
+    # For safety, compare original URL with reconstructed URL.  The check
+    # guards against the character translation corrupting the parse; the
+    # untranslated fast path above never reaches it.
 
     url_parts = [
         result.get('scheme'),
@@ -631,69 +760,64 @@ def parse_database_url(original_senzing_database_url):
 
 
 def parse_database_url_scheme(senzing_database_url):
-    return senzing_database_url.split(':')[0]
+    return senzing_database_url.partition(':')[0]
 
 # -----------------------------------------------------------------------------
 # Configuration
 # -----------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
 def get_g2_database_url_raw(generic_database_url):
     ''' Given a canonical database URL, transform to the specific URL. '''
 
-    result = ""
     parsed_database_url = parse_database_url(generic_database_url)
     scheme = parsed_database_url.get('scheme')
 
     # Format database URL for a particular database.
 
-    if scheme in ['mysql']:
-        result = "{scheme}://{username}:{password}@{hostname}:{port}/?schema={schema}".format(**parsed_database_url)
-    elif scheme in ['postgresql']:
-        result = "{scheme}://{username}:{password}@{hostname}:{port}:{schema}/".format(**parsed_database_url)
-    elif scheme in ['db2']:
-        result = "{scheme}://{username}:{password}@{schema}".format(**parsed_database_url)
-    elif scheme in ['sqlite3']:
-        result = "{scheme}://{netloc}{path}".format(**parsed_database_url)
-    elif scheme in ['mssql']:
-        result = "{scheme}://{username}:{password}@{schema}".format(**parsed_database_url)
-    else:
+    database_url_format = database_url_format_map.get(scheme)
+    if database_url_format is None:
         logging.error(message_error(695, scheme, generic_database_url))
-
-    return result
+        return ""
+    return database_url_format.format_map(parsed_database_url)
 
 
 def get_configuration(args):
-    ''' Order of precedence: CLI, OS environment variables, INI file, default. '''
-    result = {}
+    ''' Order of precedence: CLI, OS environment variables, INI file, default.
+        The assembled dictionary is cached per (args, environment) so chained
+        do_* helpers share one parse instead of rebuilding it.
+    '''
 
-    # Copy default values into configuration dictionary.
+    # Snapshot the OS environment once so each key below is a dictionary probe,
+    # not a separate os.getenv() call.
 
-    for key, value in list(configuration_locator.items()):
-        result[key] = value.get('default', None)
+    env_snapshot = os.environ.copy()
 
-    # "Prime the pump" with command line args. This will be done again as the last step.
+    # Probe the cache.  The key covers every input the assembly below reads:
+    # the parsed arguments and the Senzing environment variables.
 
-    for key, value in list(args.__dict__.items()):
-        new_key = key.format(subcommand.replace('-', '_'))
-        if value:
-            result[new_key] = value
+    cache_key = (
+        tuple(sorted((key, str(value)) for key, value in vars(args).items() if value is not None)),
+        tuple(sorted((env_var, env_snapshot[env_var]) for _, env_var in configuration_locator_env_vars if env_var in env_snapshot)),
+    )
+    cached_result = configuration_cache.get(cache_key)
+    if cached_result is not None:
+        return cached_result
 
-    # Copy OS environment variables into configuration dictionary.
+    # Merge default values and OS environment variables into the configuration
+    # dictionary from the flattened locator tables.
 
-    for key, value in list(configuration_locator.items()):
-        os_env_var = value.get('env', None)
-        if os_env_var:
-            os_env_value = os.getenv(os_env_var, None)
-            if os_env_value:
-                result[key] = os_env_value
+    result = dict(configuration_locator_defaults)
+    for key, env_var in configuration_locator_env_vars:
+        os_env_value = env_snapshot.get(env_var)
+        if os_env_value:
+            result[key] = os_env_value
 
-    # Copy 'args' into configuration dictionary.
+    # Copy 'args' into configuration dictionary.  Argparse "dest" names are
+    # static identifiers, so no key rewriting is needed.
 
-    for key, value in list(args.__dict__.items()):
-        new_key = key.format(subcommand.replace('-', '_'))
-        if value:
-            result[new_key] = value
+    result.update({key: value for key, value in vars(args).items() if value})
 
     # Add program information.
 
@@ -706,35 +830,18 @@ def get_configuration(args):
     if args.subcommand:
         result['subcommand'] = args.subcommand
 
-    # Special case: Change boolean strings to booleans.
+    # Special case: Change boolean and integer strings into typed values.
+    # Coercion is driven by the "type" fields in configuration_locator, so
+    # there is no separate key list to keep in sync.
 
-    booleans = [
-        'debug',
-        'enable_db2'
-        'enable_mssql',
-        'enable_mysql',
-        'enable_postgresql',
-        'generate_ssl_keystore',
-        'update_ini_files',
-    ]
-    for boolean in booleans:
-        boolean_value = result.get(boolean)
-        if isinstance(boolean_value, str):
-            boolean_value_lower_case = boolean_value.lower()
-            if boolean_value_lower_case in ['true', '1', 't', 'y', 'yes']:
-                result[boolean] = True
-            else:
-                result[boolean] = False
-
-    # Special case: Change integer strings to integers.
-
-    integers = [
-        'delay_in_seconds',
-        'sleep_time_in_seconds',
-        ]
-    for integer in integers:
-        integer_string = result.get(integer)
-        result[integer] = int(integer_string)
+    for key, value_type in configuration_locator_types:
+        raw_value = result.get(key)
+        if value_type is bool:
+            if isinstance(raw_value, str):
+                result[key] = raw_value.lower() in true_string_values
+        elif value_type is int:
+            if not isinstance(raw_value, int):
+                result[key] = int(raw_value)
 
     # Special case:  Tailored database URL
 
@@ -750,6 +857,7 @@ def get_configuration(args):
         if parsed_database_url.get(database_url_component):
             result["database-{0}".format(database_url_component)] = parsed_database_url.get(database_url_component)
 
+    configuration_cache[cache_key] = result
     return result
 
 
@@ -791,10 +899,21 @@ def validate_configuration(config):
 
 def redact_configuration(config):
     ''' Return a shallow copy of config with certain keys removed. '''
-    result = config.copy()
-    for key in keys_to_redact:
-        result.pop(key)
-    return result
+    return {key: value for key, value in config.items() if key not in keys_to_redact_set}
+
+
+def get_engine_configuration_dictionary(config):
+    ''' Return engine_configuration_json parsed into a dictionary, or None
+        when it was not supplied.  The parse is cached on config; the JSON
+        can be many kilobytes and several callers need it.
+    '''
+    if '_cached_engine_configuration' not in config:
+        engine_configuration_json = config.get('engine_configuration_json')
+        if engine_configuration_json:
+            config['_cached_engine_configuration'] = json.loads(engine_configuration_json)
+        else:
+            config['_cached_engine_configuration'] = None
+    return config.get('_cached_engine_configuration')
 
 # -----------------------------------------------------------------------------
 # Utility functions
@@ -826,27 +945,29 @@ def delay(config):
 
 def entry_template(config):
     ''' Format of entry message. '''
-    debug = config.get("debug", False)
     config['start_time'] = time.time()
-    if debug:
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return ""
+    if config.get("debug", False):
         final_config = config
     else:
         final_config = redact_configuration(config)
-    config_json = json.dumps(final_config, sort_keys=True)
+    config_json = json_dumps(final_config)
     return message_info(297, config_json)
 
 
 def exit_template(config):
     ''' Format of exit message. '''
-    debug = config.get("debug", False)
     stop_time = time.time()
     config['stop_time'] = stop_time
     config['elapsed_time'] = stop_time - config.get('start_time', stop_time)
-    if debug:
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return ""
+    if config.get("debug", False):
         final_config = config
     else:
         final_config = redact_configuration(config)
-    config_json = json.dumps(final_config, sort_keys=True)
+    config_json = json_dumps(final_config)
     return message_info(298, config_json)
 
 
@@ -861,11 +982,60 @@ def exit_silently():
     ''' Exit program. '''
     sys.exit(1)
 
+
+def copy_file(source_file, target_file):
+    ''' Copy file contents.
+        Prefer os.copy_file_range, which copies page-cache to page-cache
+        inside the kernel; fall back to shutil.copyfile otherwise.
+    '''
+    import shutil
+    try:
+        with open(source_file, 'rb') as source:
+            with open(target_file, 'wb') as target:
+                source_fd = source.fileno()
+                target_fd = target.fileno()
+                remaining = os.fstat(source_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(source_fd, target_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+    except OSError:
+        pass
+    shutil.copyfile(source_file, target_file)
+
+
+def write_file_if_changed(filename, new_contents):
+    ''' Write new_contents to filename, atomically via a temporary file.
+        When the file already holds new_contents, skip the write entirely;
+        a digest compare decides without keeping backup copies around.
+    '''
+    import hashlib
+    new_bytes = new_contents.encode()
+    if os.path.exists(filename):
+        with open(filename, 'rb') as existing_file:
+            existing_hash = hashlib.blake2b(existing_file.read(), digest_size=16).digest()
+        if existing_hash == hashlib.blake2b(new_bytes, digest_size=16).digest():
+            logging.debug(message_debug(901, filename))
+            return
+    temporary_filename = "{0}.tmp".format(filename)
+    with open(temporary_filename, 'wb') as temporary_file:
+        temporary_file.write(new_bytes)
+    os.replace(temporary_filename, filename)
+
 # -----------------------------------------------------------------------------
 # Class: G2Client
 # -----------------------------------------------------------------------------
 
 
+class G2InitializerError(Exception):
+    ''' Raised by G2Initializer when a G2 SDK call fails.
+        The SDK error is chained as the cause.
+    '''
+
+
 class G2Initializer:
 
     def __init__(self, g2_configuration_manager, g2_config):
@@ -881,7 +1051,7 @@ class G2Initializer:
         try:
             self.g2_configuration_manager.getDefaultConfigID(default_config_id_bytearray)
         except Exception as err:
-            raise Exception("G2ConfigMgr.getDefaultConfigID({0}) failed".format(default_config_id_bytearray)) from err
+            raise G2InitializerError("G2ConfigMgr.getDefaultConfigID({0}) failed".format(default_config_id_bytearray)) from err
 
         # If a default configuration exists, there is nothing more to do.
 
@@ -896,7 +1066,7 @@ class G2Initializer:
         try:
             self.g2_config.save(config_handle, configuration_bytearray)
         except Exception as err:
-            raise Exception("G2Confg.save({0}, {1}) failed".format(config_handle, configuration_bytearray)) from err
+            raise G2InitializerError("G2Confg.save({0}, {1}) failed".format(config_handle, configuration_bytearray)) from err
 
         self.g2_config.close(config_handle)
 
@@ -907,14 +1077,14 @@ class G2Initializer:
         try:
             self.g2_configuration_manager.addConfig(configuration_bytearray.decode(), config_comment, new_config_id)
         except Exception as err:
-            raise Exception("G2ConfigMgr.addConfig({0}, {1}, {2}) failed".format(configuration_bytearray.decode(), config_comment, new_config_id)) from err
+            raise G2InitializerError("G2ConfigMgr.addConfig({0}, {1}, {2}) failed".format(configuration_bytearray.decode(), config_comment, new_config_id)) from err
 
         # Set the default configuration ID.
 
         try:
             self.g2_configuration_manager.setDefaultConfigID(new_config_id)
         except Exception as err:
-            raise Exception("G2ConfigMgr.setDefaultConfigID({0}) failed".format(new_config_id)) from err
+            raise G2InitializerError("G2ConfigMgr.setDefaultConfigID({0}) failed".format(new_config_id)) from err
 
         return new_config_id
 
@@ -923,153 +1093,214 @@ class G2Initializer:
 # -----------------------------------------------------------------------------
 
 
-def change_directory_ownership(config):
+def change_ownership_recursively(directory, uid, gid, info_enabled, permission_map=None):
+    ''' Change ownership of everything below "directory" with one scandir
+        pass per directory.  DirEntry carries the stat result from the
+        directory read, so no extra stat syscall is issued per entry.
+        Each directory is opened once and children are addressed relative
+        to its fd, so the kernel resolves one name per chown instead of
+        re-walking the absolute path.
+        When a permission_map is supplied, entries it names are chmod-ed in
+        the same pass and popped from the map, so the permission
+        specifications piggyback on the stats already in hand and the
+        caller is left with only the entries the walk never reached.
+        O_NOFOLLOW guards the entries found by the walk; the root itself
+        is resolved first, since a configured directory may legitimately
+        be a symlink.
+    '''
+    stack = [(os.open(os.path.realpath(directory), os.O_DIRECTORY | os.O_NOFOLLOW), directory)]
+    try:
+        while stack:
+            directory_fd, directory_path = stack.pop()
+            try:
+                with os.scandir(directory_fd) as entries:
+                    for entry in entries:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        entry_path = "{0}/{1}".format(directory_path, entry.name)
+                        if (entry_stat.st_uid, entry_stat.st_gid) != (uid, gid):
+                            if info_enabled:
+                                logging.info(message_info(152, entry_path, "{0}:{1}".format(entry_stat.st_uid, entry_stat.st_gid), "{0}:{1}".format(uid, gid)))
+                            os.chown(entry.name, uid, gid, dir_fd=directory_fd, follow_symlinks=False)
+                        if permission_map:
+                            requested_permissions = permission_map.pop(entry_path, None)
+                            if requested_permissions is not None:
+                                actual_permissions = entry_stat.st_mode & 0o777
+                                if actual_permissions != requested_permissions:
+                                    if info_enabled:
+                                        logging.info(message_info(151, entry_path, actual_permissions, requested_permissions))
+                                    os.chmod(entry.name, requested_permissions, dir_fd=directory_fd)
+                        if entry.is_dir(follow_symlinks=False):
+                            entry_fd = os.open(entry.name, os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=directory_fd)
+                            stack.append((entry_fd, entry_path))
+            finally:
+                os.close(directory_fd)
+    finally:
+
+        # If a scan raised mid-walk, descriptors already pushed for
+        # not-yet-visited directories are still open; release them.
+
+        for directory_fd, _ in stack:
+            os.close(directory_fd)
+
+
+def change_ownership_and_permissions(config):
+    ''' Apply ownership to the Senzing directory trees and the file
+        permission specifications in one fused traversal.  Specification
+        paths the walk visits are chmod-ed from the walk's own stat data;
+        whatever the walk did not reach (a tree skipped by the warm-start
+        marker, or absent trees) falls back to a direct per-file pass.
+    '''
 
     etc_dir = config.get("etc_dir")
     var_dir = config.get("var_dir")
-    uid = config.get("uid")
-    gid = config.get("gid")
+    uid = int(config.get("uid"))
+    gid = int(config.get("gid"))
 
     directories = [
         etc_dir,
         var_dir,
-        "/opt/microsoft/msodbcsql17/etc/",
-        "/opt/IBM/db2/clidriver/cfg/"
+        "/opt/microsoft/msodbcsql17/etc",
+        "/opt/IBM/db2/clidriver/cfg"
     ]
 
-    for directory in directories:
-        if os.path.isdir(directory):
-            actual_uid = os.stat(directory).st_uid
-            actual_gid = os.stat(directory).st_gid
+    # Fast path for non-root runs targeting the caller's own uid/gid:
+    # files this user owns need no chown and files it does not own cannot
+    # be chowned, so only the permission specifications are worth visiting.
+
+    if os.geteuid() != 0 and (uid, gid) == (os.geteuid(), os.getgid()):
+        change_file_permissions(config)
+        return
 
-            if (actual_uid, actual_gid) != (uid, gid):
-                logging.info(message_info(152, directory, "{0}:{1}".format(actual_uid, actual_gid), "{0}:{1}".format(uid, gid)))
-                os.chown(directory, int(uid), int(gid))
+    permission_map = {filename_template.format(etc=etc_dir, var=var_dir): permissions for filename_template, permissions in file_permission_specifications}
 
-            for root, dirs, files in os.walk(directory):
-                for adir in dirs:
-                    dirname = os.path.join(root, adir)
-                    actual_uid = os.stat(dirname).st_uid
-                    actual_gid = os.stat(dirname).st_gid
-                    if (actual_uid, actual_gid) != (uid, gid):
-                        logging.info(message_info(152, dirname, "{0}:{1}".format(actual_uid, actual_gid), "{0}:{1}".format(uid, gid)))
-                        os.chown(dirname, int(uid), int(gid))
+    # Only build per-entry log messages when INFO records will be emitted.
 
-                for file in files:
-                    filename = os.path.join(root, file)
-                    actual_uid = os.stat(filename).st_uid
-                    actual_gid = os.stat(filename).st_gid
-                    if (actual_uid, actual_gid) != (uid, gid):
-                        logging.info(message_info(152, filename, "{0}:{1}".format(actual_uid, actual_gid), "{0}:{1}".format(uid, gid)))
-                        os.chown(filename, int(uid), int(gid))
+    info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
 
+    # A marker xattr on the tree root records the last completed walk.
+    # On warm restarts a single getxattr replaces re-walking the tree.
 
-def change_file_permissions(config):
+    ownership_marker_name = "user.senzing_chown"
+    ownership_marker_value = "{0}:{1}".format(uid, gid).encode()
+
+    def change_ownership(directory):
+        try:
+            if os.getxattr(directory, ownership_marker_name) == ownership_marker_value:
+                return
+        except OSError:
+            pass
+
+        directory_stat = os.stat(directory)
+
+        if (directory_stat.st_uid, directory_stat.st_gid) != (uid, gid):
+            if info_enabled:
+                logging.info(message_info(152, directory, "{0}:{1}".format(directory_stat.st_uid, directory_stat.st_gid), "{0}:{1}".format(uid, gid)))
+            os.chown(directory, uid, gid)
+
+        change_ownership_recursively(directory, uid, gid, info_enabled, permission_map)
+
+        try:
+            os.setxattr(directory, ownership_marker_name, ownership_marker_value)
+        except OSError:
+            pass
+
+    # The directories are disjoint subtrees and each stat/chown is a blocking
+    # kernel round-trip that releases the GIL, so walk them concurrently.
+
+    import concurrent.futures
+    existing_directories = [directory for directory in directories if os.path.isdir(directory)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(directories)) as executor:
+        list(executor.map(change_ownership, existing_directories))
+
+    # Handle specification paths the walk did not visit; the walks pop the
+    # entries they cover, so whatever is left needs the direct pass.
+
+    if permission_map:
+        change_file_permissions(config, permission_map)
+
+
+def change_file_permissions(config, permission_map=None):
 
     # Pull information from config.
 
     etc_dir = config.get("etc_dir")
     var_dir = config.get("var_dir")
-    uid = config.get("uid")
-    gid = config.get("gid")
+    requested_file_uid = int(config.get("uid"))
+    requested_file_gid = int(config.get("gid"))
 
-    # Identify file changes.
+    # Work through the file permission specifications.
 
-    files = [
-        {
-            "filename": "{0}/G2Module.ini".format(etc_dir),
-            "permissions": 0o750,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "{0}/G2Project.ini".format(etc_dir),
-            "permissions": 0o750,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "{0}/sqlite".format(var_dir),
-            "permissions": 0o750,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "{0}/sqlite/G2C.db".format(var_dir),
-            "permissions": 0o750,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "{0}/sqlite/G2C_LIBFEAT.db".format(var_dir),
-            "permissions": 0o750,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "{0}/sqlite/G2C_RES.db".format(var_dir),
-            "permissions": 0o750,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "{0}/sqlite/G2C.db.template".format(var_dir),
-            "permissions": 0o440,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "/opt/microsoft/msodbcsql17/etc/odbc.ini",
-            "permissions": 0o750,
-            "uid": uid,
-            "gid": gid,
-        },
-        {
-            "filename": "/opt/IBM/db2/clidriver/cfg/db2dsdriver.cfg",
-            "permissions": 0o755,
-            "uid": uid,
-            "gid": gid,
-        },
-    ]
+    if permission_map is None:
+        permission_map = {filename_template.format(etc=etc_dir, var=var_dir): permissions for filename_template, permissions in file_permission_specifications}
 
-    # Work through list.
+    info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
 
-    for file in files:
-        filename = file.get("filename")
+    # Open each parent directory once and operate on basenames relative to
+    # its file descriptor, so the kernel resolves the directory path a
+    # single time instead of once per stat/chmod/chown.
 
-        # If file exists,
+    directory_fds = {}
+    try:
+        for filename, requested_file_permissions in permission_map.items():
+
+            directory, _, basename = filename.rpartition('/')
+            dir_fd = directory_fds.get(directory)
+            if dir_fd is None:
+                try:
+                    dir_fd = os.open(directory or '/', os.O_PATH | os.O_DIRECTORY)
+                except FileNotFoundError:
+                    dir_fd = -1
+                directory_fds[directory] = dir_fd
+            if dir_fd < 0:
+                continue
+
+            # Get actual file metadata with a single stat call; a missing
+            # file is skipped, as before.
+
+            try:
+                file_stat = os.stat(basename, dir_fd=dir_fd)
+            except FileNotFoundError:
+                continue
 
-        if os.path.exists(filename):
+            actual_file_permissions = file_stat.st_mode & 0o777
+            actual_file_uid = file_stat.st_uid
+            actual_file_gid = file_stat.st_gid
 
-            # Get actual and requested file metadata.
+            # Collect the per-file changes and emit one log record for all
+            # of them, instead of pushing up to three records through the
+            # handler.
 
-            actual_file_permissions = os.stat(filename).st_mode & 0o777
-            actual_file_uid = os.stat(filename).st_uid
-            actual_file_gid = os.stat(filename).st_gid
-            requested_file_permissions = file.get("permissions")
-            requested_file_uid = file.get("uid", 0)
-            requested_file_gid = file.get("gid", 0)
+            changes = []
 
             # Change permissions, if needed.
 
             if actual_file_permissions != requested_file_permissions:
-                logging.info(message_info(151, filename, actual_file_permissions, requested_file_permissions))
-                os.chmod(filename, requested_file_permissions)
+                changes.append("permissions {0:o} to {1:o}".format(actual_file_permissions, requested_file_permissions))
+                os.chmod(basename, requested_file_permissions, dir_fd=dir_fd)
 
             # Change ownership, if needed.
 
             ownership_changed = False
             if actual_file_uid != requested_file_uid:
                 ownership_changed = True
-                logging.info(message_info(152, filename, actual_file_uid, requested_file_uid))
+                changes.append("owner {0} to {1}".format(actual_file_uid, requested_file_uid))
             if actual_file_gid != requested_file_gid:
                 ownership_changed = True
-                logging.info(message_info(153, filename, actual_file_gid, requested_file_gid))
+                changes.append("group {0} to {1}".format(actual_file_gid, requested_file_gid))
             if ownership_changed:
-                os.chown(filename, int(requested_file_uid), int(requested_file_gid))
+                os.chown(basename, requested_file_uid, requested_file_gid, dir_fd=dir_fd)
+
+            if changes and info_enabled:
+                logging.info(message_info(156, filename, "Changing {0}.".format(", ".join(changes))))
+    finally:
+        for dir_fd in directory_fds.values():
+            if dir_fd >= 0:
+                os.close(dir_fd)
 
 
 def change_module_ini(config):
+    import configparser
+    import io
 
     etc_dir = config.get("etc_dir")
     new_database_url = config.get('g2_database_url_raw')
@@ -1080,13 +1311,22 @@ def change_module_ini(config):
     filename = "{0}/G2Module.ini".format(etc_dir)
     config_parser = configparser.ConfigParser()
     config_parser.optionxform = str  # Maintain case of keys.
-    config_parser.read(filename)
+
+    # Slurp the file in one read; configparser's file reader does many small
+    # buffered reads.
+
+    original_contents = ""
+    try:
+        original_contents = Path(filename).read_text()
+        config_parser.read_string(original_contents)
+    except FileNotFoundError:
+        pass
 
     # If configuration was passed in via SENZING_ENGINE_CONFIGURATION_JSON, do a straight conversion to ini
 
     if engine_configuration_json:
         logging.info(message_info(163, filename))
-        engine_configuration = json.loads(engine_configuration_json)
+        engine_configuration = get_engine_configuration_dictionary(config)
 
         for key, value in engine_configuration.items():
             config_parser[key] = value
@@ -1119,13 +1359,22 @@ def change_module_ini(config):
         message = "Removed SQL.G2CONFIGFILE"
         logging.info(message_info(156, filename, message))
 
-    # Write out contents.
+    # Write out contents, unless the rendered result is identical to what is
+    # already on disk (the common case on container warm restarts).
+
+    rendered = io.StringIO()
+    config_parser.write(rendered)
+    new_contents = rendered.getvalue()
+    if new_contents == original_contents:
+        logging.debug(message_debug(901, filename))
+        return
 
     with open(filename, 'w') as output_file:
-        config_parser.write(output_file)
+        output_file.write(new_contents)
 
 
 def change_project_ini(config):
+    import configparser
 
     etc_dir = config.get("etc_dir")
     new_database_url = config.get('g2_database_url_raw')
@@ -1139,11 +1388,11 @@ def change_project_ini(config):
     if not os.path.exists(filename):
         return
 
-    # Parse the ini file.
+    # Parse the ini file from a single read.
 
     config_parser = configparser.ConfigParser()
     config_parser.optionxform = str  # Maintain case of keys
-    config_parser.read(filename)
+    config_parser.read_string(Path(filename).read_text())
 
     # Used to remember if contents change.
 
@@ -1203,26 +1452,26 @@ def copy_files(config):
 
     files = [
         {
-            "source_file": "{0}/sqlite/G2C.db".format(var_dir),
-            "target_file": "{0}/sqlite/G2C.db.template".format(var_dir),
+            "source_file": f"{var_dir}/sqlite/G2C.db",
+            "target_file": f"{var_dir}/sqlite/G2C.db.template",
         }, {
-            "source_file": "{0}/resources/templates/G2C.db".format(g2_dir),
-            "target_file": "{0}/sqlite/G2C.db".format(var_dir),
+            "source_file": f"{g2_dir}/resources/templates/G2C.db",
+            "target_file": f"{var_dir}/sqlite/G2C.db",
         }, {
-            "source_file": "{0}/resources/templates/G2C.db".format(g2_dir),
-            "target_file": "{0}/sqlite/G2C_LIBFEAT.db".format(var_dir),
+            "source_file": f"{g2_dir}/resources/templates/G2C.db",
+            "target_file": f"{var_dir}/sqlite/G2C_LIBFEAT.db",
         }, {
-            "source_file": "{0}/resources/templates/G2C.db".format(g2_dir),
-            "target_file": "{0}/sqlite/G2C_RES.db".format(var_dir),
+            "source_file": f"{g2_dir}/resources/templates/G2C.db",
+            "target_file": f"{var_dir}/sqlite/G2C_RES.db",
         }, {
-            "source_file": "{0}/resources/templates/G2C.db.template".format(g2_dir),
-            "target_file": "{0}/sqlite/G2C.db".format(var_dir),
+            "source_file": f"{g2_dir}/resources/templates/G2C.db.template",
+            "target_file": f"{var_dir}/sqlite/G2C.db",
         }, {
-            "source_file": "{0}/resources/templates/G2C.db.template".format(g2_dir),
-            "target_file": "{0}/sqlite/G2C_LIBFEAT.db".format(var_dir),
+            "source_file": f"{g2_dir}/resources/templates/G2C.db.template",
+            "target_file": f"{var_dir}/sqlite/G2C_LIBFEAT.db",
         }, {
-            "source_file": "{0}/resources/templates/G2C.db.template".format(g2_dir),
-            "target_file": "{0}/sqlite/G2C_RES.db".format(var_dir),
+            "source_file": f"{g2_dir}/resources/templates/G2C.db.template",
+            "target_file": f"{var_dir}/sqlite/G2C_RES.db",
         }
     ]
 
@@ -1233,8 +1482,8 @@ def copy_files(config):
         # Handle files from 2.0+
 
         from_templates = {
-            "source_file": "{0}/resources/templates/{1}".format(g2_dir, template_file_name),
-            "target_file": "{0}/{1}".format(etc_dir, template_file_name),
+            "source_file": f"{g2_dir}/resources/templates/{template_file_name}",
+            "target_file": f"{etc_dir}/{template_file_name}",
         }
         files.append(from_templates)
 
@@ -1242,56 +1491,120 @@ def copy_files(config):
 
         # Handle files from 1.11.
 
-        actual_file_name = Path(template_file_name).stem
+        actual_file_name = template_file_name[:-len(".template")]
         from_etc = {
-            "source_file": "{0}/{1}".format(etc_dir, template_file_name),
-            "target_file": "{0}/{1}".format(etc_dir, actual_file_name),
+            "source_file": f"{etc_dir}/{template_file_name}",
+            "target_file": f"{etc_dir}/{actual_file_name}",
         }
         files.append(from_etc)
 
         # Handle files from 1.12 - 1.15.
 
         from_templates = {
-            "source_file": "{0}/resources/templates/{1}".format(g2_dir, template_file_name),
-            "target_file": "{0}/{1}".format(etc_dir, actual_file_name),
+            "source_file": f"{g2_dir}/resources/templates/{template_file_name}",
+            "target_file": f"{etc_dir}/{actual_file_name}",
         }
         files.append(from_templates)
 
-    # Copy files.
+    # Snapshot each directory involved with one os.scandir pass.
+    # The per-file existence checks below become set probes instead of
+    # stat syscalls; copies update the snapshot so later pairs see them.
+
+    directory_contents = {}
+
+    def directory_names(directory):
+        names = directory_contents.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            directory_contents[directory] = names
+        return names
+
+    # Determine which copies are pending.  Resolving first keeps the
+    # first-source-wins semantics: once a target is claimed, later pairs
+    # naming the same target are skipped.
+
+    # Only build per-entry log messages when records will be emitted.
+
+    root_logger = logging.getLogger()
+    info_enabled = root_logger.isEnabledFor(logging.INFO)
+    debug_enabled = root_logger.isEnabledFor(logging.DEBUG)
+
+    pending_copies = []
 
     for file in files:
         source_file = file.get("source_file")
         target_file = file.get("target_file")
+        source_directory, source_name = os.path.split(source_file)
+        target_directory, target_name = os.path.split(target_file)
 
         # Check if source file exists.
 
-        if not os.path.exists(source_file):
-            logging.debug(message_debug(902, target_file, source_file))
+        if source_name not in directory_names(source_directory):
+            if debug_enabled:
+                logging.debug(message_debug(902, target_file, source_file))
             continue
 
         # If source file exists and the target doesn't exist, copy.
 
-        if not os.path.exists(target_file):
-            logging.info(message_info(154, target_file, source_file))
-            if not os.path.exists(os.path.dirname(target_file)):
-                os.makedirs(os.path.dirname(target_file))
-            shutil.copyfile(source_file, target_file)
+        if target_name not in directory_names(target_directory):
+            if info_enabled:
+                logging.info(message_info(154, target_file, source_file))
+            pending_copies.append((source_file, target_file, target_directory))
+            directory_names(target_directory).add(target_name)
+
+    # Perform the pending copies concurrently; each copy is
+    # syscall-bound and releases the GIL while the kernel moves bytes.
+
+    if pending_copies:
+
+        def perform_copy(pending_copy):
+            source_file, target_file, target_directory = pending_copy
+            os.makedirs(target_directory, exist_ok=True)
+            copy_file(source_file, target_file)
+
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(pending_copies))) as executor:
+            list(executor.map(perform_copy, pending_copies))
 
 
 def create_g2_lic(config):
+    import base64
+    import hashlib
 
     etc_dir = config.get("etc_dir")
     license_base64_encoded = config.get('license_base64_encoded')
 
     if license_base64_encoded:
         output_file_name = "{0}/g2.lic".format(etc_dir)
+        checksum_file_name = "{0}.sha256".format(output_file_name)
+        license_checksum = hashlib.sha256(license_base64_encoded.encode()).hexdigest()
+
+        # On warm restarts (e.g. Kubernetes restart loops) the same license is
+        # already installed.  Compare the recorded checksum of the encoded
+        # text and skip the decode and write entirely.
+
+        try:
+            if Path(checksum_file_name).read_text() == license_checksum and os.path.exists(output_file_name):
+                logging.debug(message_debug(901, output_file_name))
+                return
+        except FileNotFoundError:
+            pass
+
         logging.info(message_info(157, output_file_name))
         with open(output_file_name, "wb") as output_file:
             output_file.write(base64.b64decode(license_base64_encoded))
+        with open(checksum_file_name, "w") as checksum_file:
+            checksum_file.write(license_checksum)
 
 
 def create_keystore_truststore (config):
     ''' Create key stores and trust stores, which are used by Senzing API server'''
+    import base64
+
     etc_dir = config.get("etc_dir")
 
     # default keystore password is change-it
@@ -1341,16 +1654,23 @@ def delete_files(config):
 
     etc_dir = config.get("etc_dir")
 
-    # Files to copy.
+    # Files to delete, as directory-to-names sets so each directory is
+    # scanned once and candidates are hash probes instead of stat calls.
 
-    files = [
-        "{0}/g2config.json".format(etc_dir),
-    ]
+    files_to_delete = {
+        etc_dir: frozenset(["g2config.json"]),
+    }
 
-    # Copy files.
+    # Delete files.
 
-    for file in files:
-        if os.path.exists(file):
+    for directory, names_to_delete in files_to_delete.items():
+        try:
+            with os.scandir(directory) as entries:
+                present_names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            continue
+        for name in names_to_delete & present_names:
+            file = f"{directory}/{name}"
             logging.info(message_info(155, file))
             os.remove(file)
 
@@ -1364,7 +1684,6 @@ def database_initialization_db2(config):
 
     input_filename = "/opt/IBM/db2/clidriver/cfg/db2dsdriver.cfg.senzing-template"
     output_filename = "/opt/IBM/db2/clidriver/cfg/db2dsdriver.cfg"
-    backup_filename = "{0}.{1}".format(output_filename, int(time.time()))
 
     # Detect error and exit, if needed.
 
@@ -1372,35 +1691,23 @@ def database_initialization_db2(config):
         logging.warning(message_warning(510, input_filename))
         return result
 
-    # Backup existing file.
-
-    if os.path.exists(output_filename):
-        os.rename(output_filename, backup_filename)
-
-    # Create new file from input_filename template. If engine_configuration_json is specified then
+    # Determine new file contents. If engine_configuration_json is specified then
     # use engine_configuration_json to create db2dsdriver.cfg
 
     if config.get('engine_configuration_json'):
-        db2dsdriver_contents = config.get('db2dsdriver_cfg_contents')
-        if db2dsdriver_contents is None:
+        new_contents = config.get('db2dsdriver_cfg_contents')
+        if new_contents is None:
             exit_error(703)
-
-        with open(output_filename, 'w') as out_file:
-            out_file.write(db2dsdriver_contents)
     else:
         logging.info(message_info(160, output_filename, input_filename))
-        with open(input_filename, 'r') as in_file:
-            with open(output_filename, 'w') as out_file:
-                for line in in_file:
-                    out_file.write(line.format(**parsed_database_url))
 
-    # Remove backup file if it is the same as the new file.
+        # Slurp the template and render it with a single format pass;
+        # format_map avoids copying the parsed URL into kwargs.
 
-    if os.path.exists(backup_filename):
-        if filecmp.cmp(output_filename, backup_filename):
-            os.remove(backup_filename)
-        else:
-            logging.info(message_info(161, backup_filename, output_filename))
+        with open(input_filename, 'r') as in_file:
+            new_contents = in_file.read().format_map(parsed_database_url)
+
+    write_file_if_changed(output_filename, new_contents)
 
     return result
 
@@ -1426,7 +1733,6 @@ def database_initialization_mssql(config):
 
     input_filename = "/etc/odbc.ini.mssql-template"
     output_filename = "/opt/microsoft/msodbcsql17/etc/odbc.ini"
-    backup_filename = "{0}.{1}".format(output_filename, int(time.time()))
 
     # Detect error and exit, if needed.
 
@@ -1437,51 +1743,41 @@ def database_initialization_mssql(config):
             logging.info(message_warning(157, input_filename))
             in_file.write(database_initialization_mssql_odbc_ini_mssql_template.__doc__)
 
-    # Backup existing file.
-
-    if os.path.exists(output_filename):
-        os.rename(output_filename, backup_filename)
-
     # Create output directory.
 
     output_directory = os.path.dirname(output_filename)
     logging.info(message_info(162, output_directory))
 
     try:
-        if not os.path.exists(output_directory):
-            os.makedirs(output_directory)
+        os.makedirs(output_directory, exist_ok=True)
     except PermissionError as err:
         exit_error(702, output_directory, err)
 
-    # Create new file from input_filename template. If engine_configuration_json is specified then
+    # Determine new file contents. If engine_configuration_json is specified then
     # use mssql_odbc_ini_contents to create osbc.ini
 
     if config.get('engine_configuration_json'):
-        odbc_ini_contents = config.get('mssql_odbc_ini_contents')
-        if odbc_ini_contents is None:
+        new_contents = config.get('mssql_odbc_ini_contents')
+        if new_contents is None:
             exit_error(704)
-
-        with open(output_filename, 'w') as out_file:
-            out_file.write(odbc_ini_contents)
     else:
         logging.info(message_info(160, output_filename, input_filename))
-        with open(input_filename, 'r') as in_file:
-            with open(output_filename, 'w') as out_file:
-                for line in in_file:
-                    out_file.write(line.format(**parsed_database_url))
 
-    # Remove backup file if it is the same as the new file.
+        # Slurp the template and render it with a single format pass;
+        # format_map avoids copying the parsed URL into kwargs.
 
-    if os.path.exists(backup_filename):
-        if filecmp.cmp(output_filename, backup_filename):
-            os.remove(backup_filename)
-        else:
-            logging.info(message_info(161, backup_filename, output_filename))
+        with open(input_filename, 'r') as in_file:
+            new_contents = in_file.read().format_map(parsed_database_url)
+
+    write_file_if_changed(output_filename, new_contents)
 
     return result
 
 
 def database_initialization_mysql(config):
+    import shutil
+    import urllib.request
+
     logging.info(message_info(185))
     result = None
 
@@ -1492,33 +1788,47 @@ def database_initialization_mysql(config):
 
     # Download the file.
 
-    if not os.path.exists(filename):
-        if not os.path.exists(os.path.dirname(filename)):
-            os.makedirs(os.path.dirname(filename))
+    if not os.path.lexists(filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
         with urllib.request.urlopen(url) as response:
             with open(filename, 'wb') as out_file:
                 logging.info(message_info(159, filename, url))
-                shutil.copyfileobj(response, out_file)
+                shutil.copyfileobj(response, out_file, length=1024 * 1024)
 
-    # Create file using "dpkg".
+    # Create file using "dpkg".  Chain the processes directly instead of
+    # handing the pipeline to a shell; that skips the /bin/sh fork and the
+    # shell-managed redirection.
 
-    if not os.path.exists(libmysqlclient):
-        command = "dpkg --fsys-tarfile /opt/senzing/g2/download/libmysqlclient.deb | tar xOf - ./usr/lib/x86_64-linux-gnu/libmysqlclient.so.21.1.20  > {0}".format(libmysqlclient)
+    if not os.path.lexists(libmysqlclient):
+        import subprocess
         os.environ["DEBIAN_FRONTEND"] = "noninteractive"
         logging.info(message_info(157, libmysqlclient))
-        os.system(command)
+        with open(libmysqlclient, 'wb') as out_file:
+            with subprocess.Popen(["dpkg", "--fsys-tarfile", filename], stdout=subprocess.PIPE) as dpkg_process, \
+                 subprocess.Popen(["tar", "xOf", "-", "./usr/lib/x86_64-linux-gnu/libmysqlclient.so.21.1.20"], stdin=dpkg_process.stdout, stdout=out_file) as tar_process:
+                dpkg_process.stdout.close()
+                tar_process.wait()
+                dpkg_process.wait()
+
+    # Change file permissions.  One stat drives the decision; a missing
+    # library (failed extraction) skips the chmod instead of raising.
 
-    # Change file permissions.
+    try:
+        libmysqlclient_stat = os.stat(libmysqlclient)
+    except FileNotFoundError:
+        libmysqlclient_stat = None
 
-    actual_file_permissions = os.stat(libmysqlclient).st_mode & 0o777
-    requested_file_permissions = 0o755
-    if actual_file_permissions != requested_file_permissions:
-        logging.info(message_info(151, libmysqlclient, actual_file_permissions, requested_file_permissions))
-        os.chmod(libmysqlclient, requested_file_permissions)
+    if libmysqlclient_stat is not None:
+        actual_file_permissions = libmysqlclient_stat.st_mode & 0o777
+        requested_file_permissions = 0o755
+        if actual_file_permissions != requested_file_permissions:
+            logging.info(message_info(151, libmysqlclient, actual_file_permissions, requested_file_permissions))
+            os.chmod(libmysqlclient, requested_file_permissions)
 
-    # Make a soft link
+    # Make a soft link.  lexists checks the link itself without
+    # dereferencing, so a dangling link is not re-created over.
 
-    if not os.path.exists(libmysqlclient_link):
+    if not os.path.lexists(libmysqlclient_link):
         libmysqlclient_filename = os.path.basename(libmysqlclient)
         logging.info(message_info(158, libmysqlclient_link, libmysqlclient))
         os.symlink(libmysqlclient_filename, libmysqlclient_link)
@@ -1537,14 +1847,21 @@ def database_initialization_postgresql(config):
 
 
 def install_senzing_postgresql_governor_file(config, senzing_governor_path):
-    if not os.path.exists(senzing_governor_path):
+    import shutil
+    import urllib.request
+
+    if not os.path.lexists(senzing_governor_path):
         if os.path.exists(os.path.dirname(senzing_governor_path)):
             governor_url = config.get("governor_url")
             logging.info(message_info(180, senzing_governor_path, governor_url))
             try:
-                urllib.request.urlretrieve(
-                    governor_url,
-                    senzing_governor_path)
+
+                # Stream the download with a 1 MiB buffer rather than
+                # buffering the whole payload in memory.
+
+                with urllib.request.urlopen(governor_url) as response:
+                    with open(senzing_governor_path, 'wb') as output_file:
+                        shutil.copyfileobj(response, output_file, length=1024 * 1024)
             except urllib.error.URLError as err:
                 logging.warning(message_warning(301, governor_url, err))
             except OSError:
@@ -1579,9 +1896,8 @@ def database_initialization(config):
 
     # If engine_configuration_json given, find the scheme and make sure all of the schemes are the same.
 
-    engine_configuration_json = config.get('engine_configuration_json')
-    if engine_configuration_json:
-        engine_configuration_dict = json.loads(engine_configuration_json)
+    engine_configuration_dict = get_engine_configuration_dictionary(config)
+    if engine_configuration_dict:
         hybrid = engine_configuration_dict.get('HYBRID', {})
         database_keys = set(hybrid.values())
 
@@ -1664,12 +1980,17 @@ def get_g2_configuration_dictionary(config):
 
 
 def get_g2_configuration_json(config):
-    ''' Return a JSON string with Senzing configuration. '''
-    result = ""
-    if config.get('engine_configuration_json'):
-        result = config.get('engine_configuration_json')
-    else:
-        result = json.dumps(get_g2_configuration_dictionary(config))
+    ''' Return a JSON string with Senzing configuration.
+        The rendered string is cached on config so every G2 resource built
+        from the same configuration shares one copy.
+    '''
+    result = config.get('_cached_configuration_json')
+    if result is None:
+        if config.get('engine_configuration_json'):
+            result = config.get('engine_configuration_json')
+        else:
+            result = json.dumps(get_g2_configuration_dictionary(config))
+        config['_cached_configuration_json'] = result
     return result
 
 # -----------------------------------------------------------------------------
@@ -1677,6 +1998,21 @@ def get_g2_configuration_json(config):
 # -----------------------------------------------------------------------------
 
 
+def import_senzing_sdk():
+    ''' Import the Senzing SDK classes on first use. '''
+    global G2Config, G2ConfigMgr, G2ModuleException
+
+    if G2Config is not None:
+        return
+
+    if senzing_sdk_version_major == 2:
+        from G2Config import G2Config
+        from G2ConfigMgr import G2ConfigMgr
+        from G2Exception import G2ModuleException
+    else:
+        from senzing import G2Config, G2ConfigMgr, G2ModuleException
+
+
 def get_g2_config(config, g2_config_name="init-container-G2-config"):
     ''' Get the G2Config resource. '''
     logging.debug(message_debug(950, sys._getframe().f_code.co_name))
@@ -1685,6 +2021,8 @@ def get_g2_config(config, g2_config_name="init-container-G2-config"):
     if g2_config_singleton:
         return g2_config_singleton
 
+    import_senzing_sdk()
+
     try:
         g2_configuration_json = get_g2_configuration_json(config)
         result = G2Config()
@@ -1713,6 +2051,8 @@ def get_g2_configuration_manager(config, g2_configuration_manager_name="init-con
     if g2_configuration_manager_singleton:
         return g2_configuration_manager_singleton
 
+    import_senzing_sdk()
+
     try:
         g2_configuration_json = get_g2_configuration_json(config)
         result = G2ConfigMgr()
@@ -1775,9 +2115,12 @@ def do_debug_database_url(args):
                 exit_error(703)
             print(db2dsdriver_contents)
         else:
+            def substitute_placeholder(match):
+                return str(parsed_database_url[match.group(1)])
+
             with open(input_filename, 'r') as in_file:
                 for line in in_file:
-                    print(line.format(**parsed_database_url).replace("\n", ""))
+                    print(template_placeholder_pattern.sub(substitute_placeholder, line).replace("\n", ""))
 
 
 def do_docker_acceptance_test(args):
@@ -1826,30 +2169,33 @@ def do_initialize(args):
 
     # Manipulate files.
 
-    change_directory_ownership(config)
-    change_file_permissions(config)
-
-    # If requested, create /etc/opt/senzing/g2.lic
-
-    create_g2_lic(config)
+    change_ownership_and_permissions(config)
 
     # If requested, create sz-api-server-store.p12 my-client-key-store.p12 my-client.cer my-client-trust-store.p12
 
-    if config.get("generate_ssl_keystore"):
-        if which("keytool") is not None:
+    def create_ssl_keystores(config):
+        if config.get("generate_ssl_keystore"):
+            from shutil import which
+            if which("keytool") is not None:
 
-            # TODO: Add a "java -version" check for proper version of keytool.
+                # TODO: Add a "java -version" check for proper version of keytool.
 
-            base64_client_keystore = create_keystore_truststore(config)
+                base64_client_keystore = create_keystore_truststore(config)
 
-            # If requested, upload base64 representation of my-client-key-store.p12 to secret manager.
+                # If requested, upload base64 representation of my-client-key-store.p12 to secret manager.
 
-            if config.get("cloud") == "aws":
-                upload_aws_secrets_manager(config, base64_client_keystore)
+                if config.get("cloud") == "aws":
+                    upload_aws_secrets_manager(config, base64_client_keystore)
 
-    # If requested, create /etc/opt/senzing/G2Config.gtc
+    # The g2.lic, SSL keystore, and G2Config.gtc steps write disjoint files
+    # and wait mostly on I/O or keytool subprocesses, so overlap them.
+    # Collecting each future's result re-raises the first failure here.
 
-    create_g2config_gtc(config)
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        create_futures = [executor.submit(create_step, config) for create_step in (create_g2_lic, create_ssl_keystores, create_g2config_gtc)]
+        for create_future in create_futures:
+            create_future.result()
 
     # Get Senzing resources.
 
@@ -1862,9 +2208,10 @@ def do_initialize(args):
     try:
         default_config_id = g2_initializer.create_default_config_id()
         if default_config_id:
-            logging.info(message_info(170, default_config_id.decode()))
-    except Exception as err:
-        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+            logging.info(message_info(170, default_config_id.decode('ascii')))
+    except G2InitializerError as err:
+        cause = err.__cause__
+        logging.error(message_error(701, err, type(cause) if cause is not None else None, cause))
 
     # Cleanup.
 
@@ -1907,9 +2254,10 @@ def do_initialize_database(args):
     try:
         default_config_id = g2_initializer.create_default_config_id()
         if default_config_id:
-            logging.info(message_info(170, default_config_id.decode()))
-    except Exception as err:
-        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+            logging.info(message_info(170, default_config_id.decode('ascii')))
+    except G2InitializerError as err:
+        cause = err.__cause__
+        logging.error(message_error(701, err, type(cause) if cause is not None else None, cause))
 
     # Epilog.
 
@@ -1936,27 +2284,31 @@ def do_initialize_files(args):
     change_module_ini(config)
     change_project_ini(config)
 
-    # If requested, create /etc/opt/senzing/g2.lic
-
-    create_g2_lic(config)
-
     # If requested, create sz-api-server-store.p12 my-client-key-store.p12 my-client.cer my-client-trust-store.p12
 
-    if config.get("generate_ssl_keystore"):
-        if which("keytool") is not None:
+    def create_ssl_keystores(config):
+        if config.get("generate_ssl_keystore"):
+            from shutil import which
+            if which("keytool") is not None:
 
-            # TODO: Add a "java -version" check for proper version of keytool.
+                # TODO: Add a "java -version" check for proper version of keytool.
 
-            base64_client_keystore = create_keystore_truststore(config)
+                base64_client_keystore = create_keystore_truststore(config)
 
-            # If requested, upload base64 representation of my-client-key-store.p12 to secret manager.
+                # If requested, upload base64 representation of my-client-key-store.p12 to secret manager.
 
-            if config.get("cloud") == "aws":
-                upload_aws_secrets_manager(config, base64_client_keystore)
+                if config.get("cloud") == "aws":
+                    upload_aws_secrets_manager(config, base64_client_keystore)
 
-    # If requested, create /etc/opt/senzing/G2Config.gtc
+    # The g2.lic, SSL keystore, and G2Config.gtc steps write disjoint files
+    # and wait mostly on I/O or keytool subprocesses, so overlap them.
+    # Collecting each future's result re-raises the first failure here.
 
-    create_g2config_gtc(config)
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        create_futures = [executor.submit(create_step, config) for create_step in (create_g2_lic, create_ssl_keystores, create_g2config_gtc)]
+        for create_future in create_futures:
+            create_future.result()
 
     # Database specific operations.
 
@@ -1964,8 +2316,7 @@ def do_initialize_files(args):
 
     # Manipulate files.
 
-    change_directory_ownership(config)
-    change_file_permissions(config)
+    change_ownership_and_permissions(config)
 
     # Cleanup.
 
@@ -1998,10 +2349,14 @@ def do_sleep(args):
         time.sleep(sleep_time_in_seconds)
 
     else:
-        sleep_time_in_seconds = 3600
+
+        # Block in the kernel until a signal arrives.  The handlers
+        # installed in __main__ terminate the process, so there are no
+        # hourly wakeups just to log and go back to sleep.
+
+        logging.info(message_info(295))
         while True:
-            logging.info(message_info(295))
-            time.sleep(sleep_time_in_seconds)
+            signal.pause()
 
     # Epilog.
 
@@ -2018,23 +2373,51 @@ def do_version(args):
 # -----------------------------------------------------------------------------
 
 
+# Subcommand dispatch table, built once so invocation is a single dict
+# probe instead of a name-mangling format plus a globals() lookup.
+
+subcommand_dispatch_table = {
+    'debug-database-url': do_debug_database_url,
+    'docker-acceptance-test': do_docker_acceptance_test,
+    'initialize': do_initialize,
+    'initialize-database': do_initialize_database,
+    'initialize-files': do_initialize_files,
+    'sleep': do_sleep,
+    'version': do_version,
+}
+
 if __name__ == "__main__":
 
-    # Configure logging. See https://docs.python.org/2/library/logging.html#levels
+    # Configure logging.  Thread, process, and multiprocessing names are
+    # never printed by log_format, so skip collecting them per record.
 
-    log_level_map = {
-        "notset": logging.NOTSET,
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "fatal": logging.FATAL,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL
-    }
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
-    log_level_parameter = os.getenv("SENZING_LOG_LEVEL", "info").lower()
+    # Snapshot the environment variables __main__ reads into locals.
+
+    env_snapshot = os.environ
+    log_level_parameter = env_snapshot.get("SENZING_LOG_LEVEL", "info").lower()
     log_level = log_level_map.get(log_level_parameter, logging.INFO)
-    logging.basicConfig(format=log_format, level=log_level)
+
+    # Route records through a queue so logging calls on the work path never
+    # block on stderr; a single listener thread drains to the real handler
+    # and is flushed at exit.
+
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_stream_handler = logging.StreamHandler()
+    log_stream_handler.setFormatter(logging.Formatter(log_format))
+    log_listener = QueueListener(queue.SimpleQueue(), log_stream_handler, respect_handler_level=True)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(QueueHandler(log_listener.queue))
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
     logging.debug(message_debug(998))
 
     # Trap signals temporarily until args are parsed.
@@ -2047,18 +2430,28 @@ if __name__ == "__main__":
     if not senzing_sdk_version_major:
         logging.warning(message_warning(879))
 
+    # Fast path: "version" takes no options, so skip argument parsing and
+    # signal-handler installation entirely.
+
+    if len(sys.argv) == 2 and sys.argv[1] == "version":
+        do_version(argparse.Namespace(subcommand="version"))
+        sys.exit(0)
+
     # Parse the command line arguments.
 
-    subcommand = os.getenv("SENZING_SUBCOMMAND", None)
-    parser = get_parser()
+    # Building the argparse tree costs tens of milliseconds, so only the
+    # branches that parse or print help construct it.
+
+    subcommand = env_snapshot.get("SENZING_SUBCOMMAND")
     if len(sys.argv) > 1:
-        args = parser.parse_args()
+        requested_subcommand = sys.argv[1] if sys.argv[1] in subcommands else None
+        args = get_parser(requested_subcommand).parse_args()
         subcommand = args.subcommand
     elif subcommand:
         args = argparse.Namespace(subcommand=subcommand)
     else:
-        parser.print_help()
-        if len(os.getenv("SENZING_DOCKER_LAUNCHED", "")):
+        get_parser().print_help()
+        if env_snapshot.get("SENZING_DOCKER_LAUNCHED"):
             subcommand = "sleep"
             args = argparse.Namespace(subcommand=subcommand)
             do_sleep(args)
@@ -2070,17 +2463,12 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Transform subcommand from CLI parameter to function name string.
-
-    subcommand_function_name = "do_{0}".format(subcommand.replace('-', '_'))
+    # Look up the subcommand's function in the dispatch table.
 
-    # Test to see if function exists in the code.
-
-    if subcommand_function_name not in globals():
+    subcommand_function = subcommand_dispatch_table.get(subcommand)
+    if subcommand_function is None:
         logging.warning(message_warning(596, subcommand))
-        parser.print_help()
+        get_parser().print_help()
         exit_silently()
 
-    # Tricky code for calling function based on string.
-
-    globals()[subcommand_function_name](args)
+    subcommand_function(args)